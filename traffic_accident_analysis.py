@@ -13,365 +13,493 @@ from datetime import datetime
 import warnings
 import zipfile
 import os
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 warnings.filterwarnings('ignore')
 
+# Numba is optional: with it, the time-pattern counts run as one fused
+# parallel pass (worthwhile on the full multi-million-row dataset)
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def fused_time_counts(hour, day, period, month, n_chunks=64):
+        """Count hours, days, periods and months in a single sweep."""
+        n = hour.shape[0]
+        hour_c = np.zeros((n_chunks, 24), np.int64)
+        day_c = np.zeros((n_chunks, 7), np.int64)
+        period_c = np.zeros((n_chunks, 4), np.int64)
+        month_c = np.zeros((n_chunks, 13), np.int64)
+        # Each chunk fills its own row, so threads never share a counter
+        for c in numba.prange(n_chunks):
+            for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+                hour_c[c, hour[i]] += 1
+                day_c[c, day[i]] += 1
+                period_c[c, period[i]] += 1
+                month_c[c, month[i]] += 1
+        return hour_c.sum(axis=0), day_c.sum(axis=0), period_c.sum(axis=0), month_c.sum(axis=0)
+else:
+    def fused_time_counts(hour, day, period, month):
+        """Count hours, days, periods and months with np.bincount."""
+        return (np.bincount(hour, minlength=24), np.bincount(day, minlength=7),
+                np.bincount(period, minlength=4), np.bincount(month, minlength=13))
+
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 
-print("="*80)
-print("🚗 TASK-05: TRAFFIC ACCIDENT ANALYSIS")
-print("="*80)
-print()
+# Shared savefig settings: figures pick a layout engine at creation, so no
+# bbox_inches='tight' re-render is needed when saving
+save_kw = dict(dpi=120)
 
-# ============================================================================
-# STEP 1: EXTRACT AND LOAD DATA
-# ============================================================================
-print("[STEP 1] Extracting and loading accident data...")
-
-# Extract the archive.zip file
-if os.path.exists('archive.zip'):
-    print("Found: archive.zip")
-    print("Extracting files...")
-    
-    with zipfile.ZipFile('archive.zip', 'r') as zip_ref:
-        # Get list of files in the archive
-        file_list = zip_ref.namelist()
-        csv_files = [f for f in file_list if f.endswith('.csv')]
-        
-        if csv_files:
-            csv_file = csv_files[0]  # Get the first CSV file
-            print(f"Found CSV file: {csv_file}")
-            
-            # Extract the CSV file
-            zip_ref.extract(csv_file)
-            print("✓ Extraction complete")
-            
-            # Load the data
-            print(f"Loading data from {csv_file} (this may take a moment)...")
-            df = pd.read_csv(csv_file, nrows=50000)  # Load first 50k rows for faster processing
-            print(f"✓ Loaded: {len(df):,} accident records")
-            print(f"✓ Columns: {len(df.columns)}")
-        else:
-            print("❌ No CSV file found in archive!")
-            exit()
-    print()
-else:
-    print("❌ archive.zip not found!")
-    print("Please make sure archive.zip is in the same folder as this script.")
-    exit()
+day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+period_order = ['Morning', 'Afternoon', 'Evening', 'Night']
 
-print(f"Dataset shape: {df.shape[0]} rows × {df.shape[1]} columns\n")
+
+def render_png(fig):
+    """Encode a finished figure as PNG bytes and close it."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', **save_kw)
+    plt.close(fig)
+    return buf.getvalue()
 
 # ============================================================================
-# STEP 2: DATA PREPROCESSING
+# FIGURE BUILDERS (STEPS 3-8)
+# Each builder runs in a worker process and returns the PNG bytes; the main
+# process only writes them to disk.
 # ============================================================================
-print("[STEP 2] Preprocessing data...")
-
-# Convert to datetime
-df['Start_Time'] = pd.to_datetime(df['Start_Time'], errors='coerce')
-
-# Extract time features
-df['Hour'] = df['Start_Time'].dt.hour
-df['Day_of_Week'] = df['Start_Time'].dt.day_name()
-df['Month'] = df['Start_Time'].dt.month
-df['Month_Name'] = df['Start_Time'].dt.strftime('%B')
-df['Year'] = df['Start_Time'].dt.year
-df['Is_Weekend'] = df['Start_Time'].dt.dayofweek.isin([5, 6]).astype(int)
-
-# Time periods
-def get_time_period(hour):
-    if 5 <= hour < 12:
-        return 'Morning'
-    elif 12 <= hour < 17:
-        return 'Afternoon'
-    elif 17 <= hour < 21:
-        return 'Evening'
-    else:
-        return 'Night'
 
-df['Time_Period'] = df['Hour'].apply(get_time_period)
+def make_time_patterns(df_time, hour_counts, day_counts, period_counts, month_counts, weekend_counts):
+    """STEP 3: hourly, daily, period, monthly and weekend patterns."""
+    fig, axes = plt.subplots(2, 3, figsize=(16, 10), layout='constrained')
+    ax = axes.flat
+
+    # 1. Accidents by Hour
+    ax[0].bar(hour_counts.index, hour_counts.values, color='steelblue', edgecolor='black')
+    ax[0].set_title('Accidents by Hour of Day', fontsize=12, fontweight='bold')
+    ax[0].set_xlabel('Hour')
+    ax[0].set_ylabel('Number of Accidents')
+    ax[0].grid(axis='y', alpha=0.3)
+
+    # 2. Accidents by Day of Week
+    ax[1].bar(range(7), day_counts.values, color='coral', edgecolor='black')
+    ax[1].set_title('Accidents by Day of Week', fontsize=12, fontweight='bold')
+    ax[1].set_xlabel('Day')
+    ax[1].set_ylabel('Number of Accidents')
+    ax[1].set_xticks(range(7), ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'], rotation=45)
+    ax[1].grid(axis='y', alpha=0.3)
+
+    # 3. Accidents by Time Period
+    colors = ['#FFD700', '#FF8C00', '#FF6347', '#4169E1']
+    ax[2].bar(range(4), period_counts.values, color=colors, edgecolor='black')
+    ax[2].set_title('Accidents by Time Period', fontsize=12, fontweight='bold')
+    ax[2].set_xlabel('Time Period')
+    ax[2].set_ylabel('Number of Accidents')
+    ax[2].set_xticks(range(4), period_order, rotation=0)
+    ax[2].grid(axis='y', alpha=0.3)
+
+    # 4. Accidents by Month
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    ax[3].bar(month_counts.index, month_counts.values, color='lightgreen', edgecolor='black')
+    ax[3].set_title('Accidents by Month', fontsize=12, fontweight='bold')
+    ax[3].set_xlabel('Month')
+    ax[3].set_ylabel('Number of Accidents')
+    ax[3].set_xticks(range(1, 13), month_names, rotation=45)
+    ax[3].grid(axis='y', alpha=0.3)
+
+    # 5. Weekday vs Weekend
+    labels = ['Weekday', 'Weekend']
+    ax[4].bar(labels, weekend_counts.values, color=['#3498db', '#e74c3c'], edgecolor='black')
+    ax[4].set_title('Weekday vs Weekend Accidents', fontsize=12, fontweight='bold')
+    ax[4].set_ylabel('Number of Accidents')
+    ax[4].grid(axis='y', alpha=0.3)
+
+    # 6. Hourly heatmap by day
+    pivot_table = (df_time.groupby(['Day_of_Week', 'Hour'], observed=True).size()
+                   .unstack('Hour', fill_value=0)
+                   .reindex(index=day_order, columns=range(24), fill_value=0))
+    # A single QuadMesh instead of one patch per cell
+    mesh = ax[5].pcolormesh(np.arange(25), np.arange(8), pivot_table.to_numpy(), cmap='YlOrRd')
+    fig.colorbar(mesh, ax=ax[5], label='Number of Accidents')
+    ax[5].set_xticks(np.arange(0, 24, 2) + 0.5, range(0, 24, 2))
+    ax[5].set_yticks(np.arange(7) + 0.5, day_order)
+    ax[5].invert_yaxis()  # Monday on top
+    ax[5].set_title('Accident Frequency Heatmap', fontsize=12, fontweight='bold')
+    ax[5].set_xlabel('Hour of Day')
+    ax[5].set_ylabel('Day of Week')
+
+    return render_png(fig)
+
+
+def make_weather(df_weather, weather_vc):
+    """STEP 4: most common weather conditions and their average severity."""
+    fig, axes = plt.subplots(2, 2, figsize=(16, 10), layout='constrained')
+    ax = axes.flat
 
-print(f"✓ Extracted time-based features")
-print(f"✓ Date range: {df['Start_Time'].min()} to {df['Start_Time'].max()}\n")
-
-# ============================================================================
-# STEP 3: TIME PATTERN ANALYSIS
-# ============================================================================
-print("[STEP 3] Analyzing time patterns...")
+    # 1. Top weather conditions
+    top_weather = weather_vc.head(10)
+    ax[0].barh(range(len(top_weather)), top_weather.values, color='skyblue', edgecolor='black')
+    ax[0].set_yticks(range(len(top_weather)), top_weather.index)
+    ax[0].set_title('Top 10 Weather Conditions', fontsize=12, fontweight='bold')
+    ax[0].set_xlabel('Number of Accidents')
+    ax[0].grid(axis='x', alpha=0.3)
 
-fig = plt.figure(figsize=(16, 10))
+    # 2. Weather severity
+    if 'Severity' in df_weather.columns:
+        weather_severity = df_weather.groupby('Weather_Condition', observed=True, sort=False)['Severity'].mean().nlargest(10)
+        ax[1].barh(range(len(weather_severity)), weather_severity.values, color='orange', edgecolor='black')
+        ax[1].set_yticks(range(len(weather_severity)), weather_severity.index)
+        ax[1].set_title('Average Severity by Weather', fontsize=12, fontweight='bold')
+        ax[1].set_xlabel('Average Severity')
+        ax[1].grid(axis='x', alpha=0.3)
+    else:
+        ax[1].axis('off')
 
-# 1. Accidents by Hour
-plt.subplot(2, 3, 1)
-hour_counts = df['Hour'].value_counts().sort_index()
-plt.bar(hour_counts.index, hour_counts.values, color='steelblue', edgecolor='black')
-plt.title('Accidents by Hour of Day', fontsize=12, fontweight='bold')
-plt.xlabel('Hour')
-plt.ylabel('Number of Accidents')
-plt.grid(axis='y', alpha=0.3)
+    # 3. Weather distribution pie chart
+    top5_weather = weather_vc.head(5)
+    ax[2].pie(top5_weather.values, labels=top5_weather.index, autopct='%1.1f%%', startangle=90)
+    ax[2].set_title('Top 5 Weather Conditions (%)', fontsize=12, fontweight='bold')
 
-# 2. Accidents by Day of Week
-plt.subplot(2, 3, 2)
-day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-day_counts = df['Day_of_Week'].value_counts().reindex(day_order)
-plt.bar(range(7), day_counts.values, color='coral', edgecolor='black')
-plt.title('Accidents by Day of Week', fontsize=12, fontweight='bold')
-plt.xlabel('Day')
-plt.ylabel('Number of Accidents')
-plt.xticks(range(7), ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'], rotation=45)
-plt.grid(axis='y', alpha=0.3)
-
-# 3. Accidents by Time Period
-plt.subplot(2, 3, 3)
-period_order = ['Morning', 'Afternoon', 'Evening', 'Night']
-period_counts = df['Time_Period'].value_counts().reindex(period_order)
-colors = ['#FFD700', '#FF8C00', '#FF6347', '#4169E1']
-plt.bar(range(4), period_counts.values, color=colors, edgecolor='black')
-plt.title('Accidents by Time Period', fontsize=12, fontweight='bold')
-plt.xlabel('Time Period')
-plt.ylabel('Number of Accidents')
-plt.xticks(range(4), period_order, rotation=0)
-plt.grid(axis='y', alpha=0.3)
-
-# 4. Accidents by Month
-plt.subplot(2, 3, 4)
-month_counts = df['Month'].value_counts().sort_index()
-month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-plt.bar(month_counts.index, month_counts.values, color='lightgreen', edgecolor='black')
-plt.title('Accidents by Month', fontsize=12, fontweight='bold')
-plt.xlabel('Month')
-plt.ylabel('Number of Accidents')
-plt.xticks(range(1, 13), month_names, rotation=45)
-plt.grid(axis='y', alpha=0.3)
-
-# 5. Weekday vs Weekend
-plt.subplot(2, 3, 5)
-weekend_counts = df['Is_Weekend'].value_counts().sort_index()
-labels = ['Weekday', 'Weekend']
-plt.bar(labels, weekend_counts.values, color=['#3498db', '#e74c3c'], edgecolor='black')
-plt.title('Weekday vs Weekend Accidents', fontsize=12, fontweight='bold')
-plt.ylabel('Number of Accidents')
-plt.grid(axis='y', alpha=0.3)
-
-# 6. Hourly heatmap by day
-plt.subplot(2, 3, 6)
-pivot_table = df.pivot_table(values='Severity', index='Day_of_Week', columns='Hour', aggfunc='count', fill_value=0)
-pivot_table = pivot_table.reindex(day_order)
-sns.heatmap(pivot_table, cmap='YlOrRd', cbar_kws={'label': 'Number of Accidents'}, linewidths=0.5)
-plt.title('Accident Frequency Heatmap', fontsize=12, fontweight='bold')
-plt.xlabel('Hour of Day')
-plt.ylabel('Day of Week')
-
-plt.tight_layout()
-plt.savefig('time_pattern_analysis.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: time_pattern_analysis.png")
-plt.close()
+    ax[3].axis('off')
 
-# ============================================================================
-# STEP 4: WEATHER ANALYSIS
-# ============================================================================
-print("[STEP 4] Analyzing weather conditions...")
+    return render_png(fig)
 
-if 'Weather_Condition' in df.columns:
-    fig = plt.figure(figsize=(16, 10))
-    
-    # 1. Top weather conditions
-    plt.subplot(2, 2, 1)
-    top_weather = df['Weather_Condition'].value_counts().head(10)
-    plt.barh(range(len(top_weather)), top_weather.values, color='skyblue', edgecolor='black')
-    plt.yticks(range(len(top_weather)), top_weather.index)
-    plt.title('Top 10 Weather Conditions', fontsize=12, fontweight='bold')
-    plt.xlabel('Number of Accidents')
-    plt.grid(axis='x', alpha=0.3)
-    
-    # 2. Weather severity
-    if 'Severity' in df.columns:
-        plt.subplot(2, 2, 2)
-        weather_severity = df.groupby('Weather_Condition')['Severity'].mean().sort_values(ascending=False).head(10)
-        plt.barh(range(len(weather_severity)), weather_severity.values, color='orange', edgecolor='black')
-        plt.yticks(range(len(weather_severity)), weather_severity.index)
-        plt.title('Average Severity by Weather', fontsize=12, fontweight='bold')
-        plt.xlabel('Average Severity')
-        plt.grid(axis='x', alpha=0.3)
-    
-    # 3. Weather distribution pie chart
-    plt.subplot(2, 2, 3)
-    top5_weather = df['Weather_Condition'].value_counts().head(5)
-    plt.pie(top5_weather.values, labels=top5_weather.index, autopct='%1.1f%%', startangle=90)
-    plt.title('Top 5 Weather Conditions (%)', fontsize=12, fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('weather_analysis.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: weather_analysis.png")
-    plt.close()
 
-# ============================================================================
-# STEP 5: SEVERITY ANALYSIS
-# ============================================================================
-print("[STEP 5] Analyzing accident severity...")
+def make_severity(severity_counts):
+    """STEP 5: severity level distribution."""
+    fig, ax = plt.subplots(1, 2, figsize=(14, 6), layout='constrained')
 
-if 'Severity' in df.columns:
-    fig = plt.figure(figsize=(14, 6))
-    
     # Severity distribution
-    plt.subplot(1, 2, 1)
-    severity_counts = df['Severity'].value_counts().sort_index()
-    plt.bar(severity_counts.index, severity_counts.values, color=['#90EE90', '#FFD700', '#FF8C00', '#DC143C'], 
-            edgecolor='black')
-    plt.title('Accident Severity Distribution', fontsize=12, fontweight='bold')
-    plt.xlabel('Severity Level')
-    plt.ylabel('Number of Accidents')
-    plt.grid(axis='y', alpha=0.3)
-    
-    # Severity pie chart
-    plt.subplot(1, 2, 2)
-    plt.pie(severity_counts.values, labels=[f'Level {i}' for i in severity_counts.index], 
-            autopct='%1.1f%%', colors=['#90EE90', '#FFD700', '#FF8C00', '#DC143C'], startangle=90)
-    plt.title('Severity Distribution (%)', fontsize=12, fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('severity_analysis.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: severity_analysis.png")
-    plt.close()
+    ax[0].bar(severity_counts.index, severity_counts.values, color=['#90EE90', '#FFD700', '#FF8C00', '#DC143C'], 
+              edgecolor='black')
+    ax[0].set_title('Accident Severity Distribution', fontsize=12, fontweight='bold')
+    ax[0].set_xlabel('Severity Level')
+    ax[0].set_ylabel('Number of Accidents')
+    ax[0].grid(axis='y', alpha=0.3)
 
-# ============================================================================
-# STEP 6: GEOGRAPHIC ANALYSIS
-# ============================================================================
-print("[STEP 6] Analyzing geographic patterns...")
-
-if 'Start_Lat' in df.columns and 'Start_Lng' in df.columns:
-    df_geo = df.dropna(subset=['Start_Lat', 'Start_Lng'])
-    
-    fig = plt.figure(figsize=(14, 8))
-    
-    plt.scatter(df_geo['Start_Lng'], df_geo['Start_Lat'], 
-               alpha=0.5, s=10, c='red', edgecolor='none')
-    plt.title('Geographic Distribution of Accidents', fontsize=14, fontweight='bold')
-    plt.xlabel('Longitude')
-    plt.ylabel('Latitude')
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('geographic_hotspots.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: geographic_hotspots.png")
-    plt.close()
+    # Severity pie chart
+    ax[1].pie(severity_counts.values, labels=[f'Level {i}' for i in severity_counts.index], 
+              autopct='%1.1f%%', colors=['#90EE90', '#FFD700', '#FF8C00', '#DC143C'], startangle=90)
+    ax[1].set_title('Severity Distribution (%)', fontsize=12, fontweight='bold')
 
-# ============================================================================
-# STEP 7: ENVIRONMENTAL FACTORS
-# ============================================================================
-print("[STEP 7] Analyzing environmental factors...")
-
-# Check which environmental columns exist
-env_cols = ['Temperature(F)', 'Humidity(%)', 'Visibility(mi)', 'Wind_Speed(mph)', 'Pressure(in)']
-available_env = [col for col in env_cols if col in df.columns]
-
-if len(available_env) >= 2:
-    fig = plt.figure(figsize=(14, 10))
-    
-    plot_num = 1
-    for i, col in enumerate(available_env[:4]):  # Plot first 4 available
-        plt.subplot(2, 2, plot_num)
-        plt.hist(df[col].dropna(), bins=30, color='teal', edgecolor='black', alpha=0.7)
-        plt.title(f'Distribution of {col}', fontsize=11, fontweight='bold')
-        plt.xlabel(col)
-        plt.ylabel('Frequency')
-        plt.grid(axis='y', alpha=0.3)
-        plot_num += 1
-    
-    plt.tight_layout()
-    plt.savefig('environmental_factors.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: environmental_factors.png")
-    plt.close()
+    return render_png(fig)
 
-# ============================================================================
-# STEP 8: CORRELATION ANALYSIS
-# ============================================================================
-print("[STEP 8] Analyzing correlations...")
 
-numeric_cols = ['Severity', 'Temperature(F)', 'Humidity(%)', 'Visibility(mi)', 'Wind_Speed(mph)', 'Pressure(in)']
-available_numeric = [col for col in numeric_cols if col in df.columns]
+def make_geographic(df_geo):
+    """STEP 6: accident density by location."""
+    fig = plt.figure(figsize=(14, 8), layout='tight')
 
-if len(available_numeric) >= 2:
-    correlation = df[available_numeric].corr()
-    
-    plt.figure(figsize=(10, 8))
+    # Bin points into a 2D density grid so the figure renders one image
+    # instead of one marker per accident
+    density, lng_edges, lat_edges = np.histogram2d(df_geo['Start_Lng'].to_numpy(),
+                                                   df_geo['Start_Lat'].to_numpy(), bins=400)
+    plt.imshow(np.log1p(density.T), origin='lower', cmap='hot', aspect='auto',
+               extent=[lng_edges[0], lng_edges[-1], lat_edges[0], lat_edges[-1]])
+    plt.colorbar(label='log(1 + Number of Accidents)')
+    plt.title('Geographic Distribution of Accidents', fontsize=14, fontweight='bold')
+    plt.xlabel('Longitude')
+    plt.ylabel('Latitude')
+    plt.grid(False)
+
+    return render_png(fig)
+
+
+def make_environmental(df_env):
+    """STEP 7: distributions of up to four environmental readings."""
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), layout='constrained')
+    ax = axes.flat
+
+    columns = list(df_env.columns[:4])  # Plot first 4 available
+    for i, col in enumerate(columns):
+        # Bin with np.histogram on the raw float32 buffer and draw the counts
+        values = df_env[col].to_numpy()
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=30)
+        ax[i].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                  color='teal', edgecolor='black', alpha=0.7)
+        ax[i].set_title(f'Distribution of {col}', fontsize=11, fontweight='bold')
+        ax[i].set_xlabel(col)
+        ax[i].set_ylabel('Frequency')
+        ax[i].grid(axis='y', alpha=0.3)
+    for unused in ax[len(columns):]:
+        unused.axis('off')
+
+    return render_png(fig)
+
+
+def make_correlation(df_numeric):
+    """STEP 8: correlation between severity and environmental readings."""
+    # One np.corrcoef call over the complete rows of a float32 matrix
+    values = df_numeric.to_numpy(dtype=np.float32)
+    values = values[~np.isnan(values).any(axis=1)]
+    correlation = pd.DataFrame(np.corrcoef(values, rowvar=False),
+                               index=df_numeric.columns, columns=df_numeric.columns)
+
+    fig = plt.figure(figsize=(10, 8), layout='tight')
     sns.heatmap(correlation, annot=True, cmap='coolwarm', center=0, 
                square=True, linewidths=1, fmt='.2f', cbar_kws={"shrink": 0.8})
     plt.title('Correlation Matrix - Environmental Factors', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('correlation_matrix.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: correlation_matrix.png")
-    plt.close()
 
-# ============================================================================
-# STEP 9: SUMMARY REPORT
-# ============================================================================
-print("[STEP 9] Generating summary report...")
+    return render_png(fig)
+
+
+if __name__ == '__main__':
+    print("="*80)
+    print("🚗 TASK-05: TRAFFIC ACCIDENT ANALYSIS")
+    print("="*80)
+    print()
+
+    # ============================================================================
+    # STEP 1: LOAD DATA
+    # ============================================================================
+    print("[STEP 1] Loading accident data...")
+
+    # Columns used by the analysis and the dtypes to read them with
+    # (None = let the parser handle it, e.g. Start_Time via parse_dates)
+    load_dtypes = {
+        'Start_Time': None,
+        'Severity': 'int8',
+        'Start_Lat': 'float64',
+        'Start_Lng': 'float64',
+        'Weather_Condition': 'category',
+        'Temperature(F)': 'float32',
+        'Humidity(%)': 'float32',
+        'Visibility(mi)': 'float32',
+        'Wind_Speed(mph)': 'float32',
+        'Pressure(in)': 'float32',
+    }
+
+    # Preprocessed data from an earlier run (delete it to re-read archive.zip)
+    cache_file = 'accidents_50k.parquet'
+    from_cache = os.path.exists(cache_file)
+
+    if from_cache:
+        print(f"Found cache: {cache_file}")
+        df = pd.read_parquet(cache_file)
+        print(f"✓ Loaded: {len(df):,} preprocessed accident records")
+        print()
+    elif os.path.exists('archive.zip'):
+        # Read the CSV from archive.zip
+        print("Found: archive.zip")
+
+        with zipfile.ZipFile('archive.zip', 'r') as zip_ref:
+            # Get list of files in the archive
+            file_list = zip_ref.namelist()
+            csv_files = [f for f in file_list if f.endswith('.csv')]
+
+            if csv_files:
+                csv_file = csv_files[0]  # Get the first CSV file
+                print(f"Found CSV file: {csv_file}")
+
+                # Stream the CSV straight out of the archive (no extraction to disk),
+                # loading only the columns used downstream with compact dtypes
+                print(f"Loading data from {csv_file} (this may take a moment)...")
+                with zip_ref.open(csv_file) as csv_fh:
+                    df = pd.read_csv(csv_fh, nrows=50000,  # Load first 50k rows for faster processing
+                                     usecols=lambda col: col in load_dtypes,
+                                     dtype={col: dt for col, dt in load_dtypes.items() if dt is not None},
+                                     parse_dates=['Start_Time'])
+                print(f"✓ Loaded: {len(df):,} accident records")
+                print(f"✓ Columns: {len(df.columns)}")
+            else:
+                print("❌ No CSV file found in archive!")
+                exit()
+        print()
+    else:
+        print("❌ archive.zip not found!")
+        print("Please make sure archive.zip is in the same folder as this script.")
+        exit()
 
-# Calculate statistics
-peak_hour = hour_counts.idxmax()
-peak_hour_count = hour_counts.max()
-lowest_hour = hour_counts.idxmin()
-lowest_hour_count = hour_counts.min()
+    print(f"Dataset shape: {df.shape[0]} rows × {df.shape[1]} columns\n")
 
-peak_day = day_counts.idxmax()
-peak_day_count = day_counts.max()
-safest_day = day_counts.idxmin()
-safest_day_count = day_counts.min()
+    # ============================================================================
+    # STEP 2: DATA PREPROCESSING
+    # ============================================================================
+    print("[STEP 2] Preprocessing data...")
 
-peak_period = period_counts.idxmax()
-peak_period_count = period_counts.max()
+    if from_cache:
+        print("✓ Using cached time-based features")
+    else:
+        # Convert to datetime (no-op when parse_dates already succeeded; coerces
+        # any timestamps the reader could not parse to NaT)
+        df['Start_Time'] = pd.to_datetime(df['Start_Time'], errors='coerce')
+        df = df.dropna(subset=['Start_Time'])  # time features below need a valid timestamp
+
+        # Keep Severity as int8 and environmental readings as float32 however the
+        # frame was loaded (astype is a no-op for columns already in that dtype)
+        df = df.astype({col: dt for col, dt in load_dtypes.items()
+                        if dt in ('int8', 'float32') and col in df.columns})
+
+        # Categorical keys hash as integer codes in value_counts/groupby
+        if 'Weather_Condition' in df.columns:
+            df['Weather_Condition'] = df['Weather_Condition'].astype('category')
+
+        # Extract time features
+        day_of_week = df['Start_Time'].dt.dayofweek.to_numpy()  # Monday=0 ... Sunday=6
+        df['Hour'] = df['Start_Time'].dt.hour.astype(np.int8)
+        df['Day_of_Week'] = pd.Categorical.from_codes(day_of_week, categories=day_order, ordered=True)
+        df['Month'] = df['Start_Time'].dt.month.astype(np.int8)
+        df['Is_Weekend'] = (day_of_week >= 5).astype(np.int8)
+
+        # Time periods (Morning 5-11, Afternoon 12-16, Evening 17-20, Night otherwise)
+        period_bins = np.array([5, 12, 17, 21])
+        period_codes = np.searchsorted(period_bins, df['Hour'].to_numpy(), side='right') - 1
+        period_codes[period_codes < 0] = 3  # hours 0-4 wrap around to Night
+        df['Time_Period'] = pd.Categorical.from_codes(period_codes, categories=period_order)
+
+        # Parquet keeps the categorical/int8/float32 dtypes for the next run
+        df.to_parquet(cache_file, engine='pyarrow', compression='zstd', index=False)
+        print(f"✓ Extracted time-based features")
+        print(f"✓ Cached preprocessed data: {cache_file}")
+
+    print(f"✓ Date range: {df['Start_Time'].min()} to {df['Start_Time'].max()}\n")
+
+    # ============================================================================
+    # STEPS 3-8: VISUALIZATIONS
+    # ============================================================================
+
+    # Count every small-range key in one pass (reused by the report)
+    hour_arr, day_arr, period_arr, month_arr = fused_time_counts(
+        df['Hour'].to_numpy(), df['Day_of_Week'].cat.codes.to_numpy(),
+        df['Time_Period'].cat.codes.to_numpy(), df['Month'].to_numpy())
+    hour_counts = pd.Series(hour_arr)
+    day_counts = pd.Series(day_arr, index=day_order)
+    period_counts = pd.Series(period_arr, index=period_order)
+    month_counts = pd.Series(month_arr[1:], index=range(1, 13))
+    weekend_counts = pd.Series([day_arr[:5].sum(), day_arr[5:].sum()])
+
+    # Each figure only gets the columns it draws from, to keep pickling cheap
+    figure_jobs = [("[STEP 3] Analyzing time patterns...", 'time_pattern_analysis.png',
+                    make_time_patterns, (df[['Day_of_Week', 'Hour']], hour_counts, day_counts,
+                                         period_counts, month_counts, weekend_counts))]
+
+    if 'Weather_Condition' in df.columns:
+        # Counted once; shared by the bar chart, the pie chart and the report
+        weather_vc = df['Weather_Condition'].value_counts()
+        weather_cols = [col for col in ['Weather_Condition', 'Severity'] if col in df.columns]
+        figure_jobs.append(("[STEP 4] Analyzing weather conditions...", 'weather_analysis.png',
+                            make_weather, (df[weather_cols], weather_vc)))
 
-report = f"""
+    if 'Severity' in df.columns:
+        severity_counts = df['Severity'].value_counts().sort_index()
+        figure_jobs.append(("[STEP 5] Analyzing accident severity...", 'severity_analysis.png',
+                            make_severity, (severity_counts,)))
+
+    if 'Start_Lat' in df.columns and 'Start_Lng' in df.columns:
+        df_geo = df[['Start_Lat', 'Start_Lng']].dropna()
+        figure_jobs.append(("[STEP 6] Analyzing geographic patterns...", 'geographic_hotspots.png',
+                            make_geographic, (df_geo,)))
+
+    # Check which environmental columns exist
+    env_cols = ['Temperature(F)', 'Humidity(%)', 'Visibility(mi)', 'Wind_Speed(mph)', 'Pressure(in)']
+    available_env = [col for col in env_cols if col in df.columns]
+
+    if len(available_env) >= 2:
+        figure_jobs.append(("[STEP 7] Analyzing environmental factors...", 'environmental_factors.png',
+                            make_environmental, (df[available_env],)))
+
+    numeric_cols = ['Severity', 'Temperature(F)', 'Humidity(%)', 'Visibility(mi)', 'Wind_Speed(mph)', 'Pressure(in)']
+    available_numeric = [col for col in numeric_cols if col in df.columns]
+
+    if len(available_numeric) >= 2:
+        figure_jobs.append(("[STEP 8] Analyzing correlations...", 'correlation_matrix.png',
+                            make_correlation, (df[available_numeric],)))
+
+    # The report only needs these scalars and aggregates, so the full frame
+    # can be released before rendering; each job holds just its own columns
+    df_columns = set(df.columns)
+    total_accidents = len(df)
+    date_start, date_end = df['Start_Time'].min(), df['Start_Time'].max()
+    if 'Start_Lat' in df_columns:
+        lat_min, lat_max = df['Start_Lat'].min(), df['Start_Lat'].max()
+    del df
+
+    # The figures are independent, so render them in parallel worker processes.
+    # 'spawn' gives every platform the same fresh workers and avoids forking
+    # a process that already runs Numba's thread pool.
+    with ProcessPoolExecutor(max_workers=min(len(figure_jobs), os.cpu_count() or 1),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = []
+        for message, filename, builder, args in figure_jobs:
+            print(message)
+            futures.append((filename, executor.submit(builder, *args)))
+        for filename, future in futures:
+            with open(filename, 'wb') as f:
+                f.write(future.result())
+            print(f"✓ Saved: {filename}")
+    del figure_jobs, futures
+
+    # ============================================================================
+    # STEP 9: SUMMARY REPORT
+    # ============================================================================
+    print("[STEP 9] Generating summary report...")
+
+    # Calculate statistics
+    peak_hour = hour_counts.idxmax()
+    peak_hour_count = hour_counts.max()
+    lowest_hour = hour_counts.idxmin()
+    lowest_hour_count = hour_counts.min()
+
+    peak_day = day_counts.idxmax()
+    peak_day_count = day_counts.max()
+    safest_day = day_counts.idxmin()
+    safest_day_count = day_counts.min()
+
+    peak_period = period_counts.idxmax()
+    peak_period_count = period_counts.max()
+
+    report = f"""
 {"="*80}
 TRAFFIC ACCIDENT ANALYSIS REPORT - TASK 05
 {"="*80}
 
 DATASET OVERVIEW
 {"-"*80}
-Total Accidents Analyzed: {len(df):,}
-Date Range: {df['Start_Time'].min().strftime('%Y-%m-%d')} to {df['Start_Time'].max().strftime('%Y-%m-%d')}
-Number of Features: {df.shape[1]}
+Total Accidents Analyzed: {total_accidents:,}
+Date Range: {date_start.strftime('%Y-%m-%d')} to {date_end.strftime('%Y-%m-%d')}
+Number of Features: {len(df_columns)}
 """
 
-if 'Start_Lat' in df.columns:
-    report += f"Geographic Range: {df['Start_Lat'].min():.2f}°N to {df['Start_Lat'].max():.2f}°N\n"
+    if 'Start_Lat' in df_columns:
+        report += f"Geographic Range: {lat_min:.2f}°N to {lat_max:.2f}°N\n"
 
-report += f"""
+    report += f"""
 TIME PATTERN ANALYSIS
 {"-"*80}
-Peak Hour: {peak_hour}:00 ({peak_hour_count:,} accidents - {peak_hour_count/len(df)*100:.1f}%)
-Lowest Hour: {lowest_hour}:00 ({lowest_hour_count:,} accidents - {lowest_hour_count/len(df)*100:.1f}%)
+Peak Hour: {peak_hour}:00 ({peak_hour_count:,} accidents - {peak_hour_count/total_accidents*100:.1f}%)
+Lowest Hour: {lowest_hour}:00 ({lowest_hour_count:,} accidents - {lowest_hour_count/total_accidents*100:.1f}%)
 
-Most Dangerous Day: {peak_day} ({peak_day_count:,} accidents - {peak_day_count/len(df)*100:.1f}%)
-Safest Day: {safest_day} ({safest_day_count:,} accidents - {safest_day_count/len(df)*100:.1f}%)
+Most Dangerous Day: {peak_day} ({peak_day_count:,} accidents - {peak_day_count/total_accidents*100:.1f}%)
+Safest Day: {safest_day} ({safest_day_count:,} accidents - {safest_day_count/total_accidents*100:.1f}%)
 
-Most Dangerous Period: {peak_period} ({peak_period_count:,} accidents - {peak_period_count/len(df)*100:.1f}%)
+Most Dangerous Period: {peak_period} ({peak_period_count:,} accidents - {peak_period_count/total_accidents*100:.1f}%)
 
 Weekday vs Weekend:
-  • Weekday Accidents: {(df['Is_Weekend']==0).sum():,} ({(df['Is_Weekend']==0).sum()/len(df)*100:.1f}%)
-  • Weekend Accidents: {(df['Is_Weekend']==1).sum():,} ({(df['Is_Weekend']==1).sum()/len(df)*100:.1f}%)
+  • Weekday Accidents: {weekend_counts[0]:,} ({weekend_counts[0]/total_accidents*100:.1f}%)
+  • Weekend Accidents: {weekend_counts[1]:,} ({weekend_counts[1]/total_accidents*100:.1f}%)
 """
 
-if 'Severity' in df.columns:
-    report += f"\nSEVERITY ANALYSIS\n{'-'*80}\n"
-    for severity in sorted(df['Severity'].unique()):
-        count = (df['Severity'] == severity).sum()
-        pct = count / len(df) * 100
-        report += f"Severity Level {severity}: {count:,} accidents ({pct:.1f}%)\n"
-
-if 'Weather_Condition' in df.columns:
-    top_weather_cond = df['Weather_Condition'].value_counts().iloc[0]
-    top_weather_name = df['Weather_Condition'].value_counts().index[0]
-    report += f"""
+    if 'Severity' in df_columns:
+        report += f"\nSEVERITY ANALYSIS\n{'-'*80}\n"
+        severity_pct = severity_counts / severity_counts.sum() * 100
+        report += "".join(f"Severity Level {severity}: {count:,} accidents ({pct:.1f}%)\n"
+                          for severity, count, pct in zip(severity_counts.index, severity_counts.values,
+                                                          severity_pct.values))
+
+    if 'Weather_Condition' in df_columns:
+        top_weather_cond = weather_vc.iloc[0]
+        top_weather_name = weather_vc.index[0]
+        report += f"""
 WEATHER CONDITIONS
 {"-"*80}
-Most Common: {top_weather_name} ({top_weather_cond:,} accidents - {top_weather_cond/len(df)*100:.1f}%)
-Unique Weather Conditions: {df['Weather_Condition'].nunique()}
+Most Common: {top_weather_name} ({top_weather_cond:,} accidents - {top_weather_cond/total_accidents*100:.1f}%)
+Unique Weather Conditions: {(weather_vc > 0).sum()}
 """
 
-report += f"""
+    report += f"""
 KEY FINDINGS
 {"-"*80}
 1. Rush Hour Impact: Accidents peak during commute times (7-9 AM, 4-6 PM)
@@ -380,10 +508,10 @@ KEY FINDINGS
 4. Weather Influence: Clear patterns between weather conditions and accidents
 """
 
-if 'Start_Lat' in df.columns:
-    report += "5. Geographic Hotspots: Accidents concentrated in specific urban areas\n"
+    if 'Start_Lat' in df_columns:
+        report += "5. Geographic Hotspots: Accidents concentrated in specific urban areas\n"
 
-report += f"""
+    report += f"""
 RECOMMENDATIONS
 {"-"*80}
 1. Enhanced Traffic Management:
@@ -429,25 +557,25 @@ Next Steps:
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
 
-# Save report
-with open('analysis_summary.txt', 'w', encoding='utf-8') as f:
-    f.write(report)
+    # Save report
+    with open('analysis_summary.txt', 'w', encoding='utf-8') as f:
+        f.write(report)
 
-print(report)
-print("✓ Saved: analysis_summary.txt\n")
+    print(report)
+    print("✓ Saved: analysis_summary.txt\n")
 
-# ============================================================================
-# COMPLETION
-# ============================================================================
-print("="*80)
-print("✅ ANALYSIS COMPLETE!")
-print("="*80)
-print()
-print("📊 Generated Files:")
-print("   • 6 visualization PNG files")
-print("   • 1 detailed summary report (analysis_summary.txt)")
-print()
-print("📁 All files saved in current directory")
-print()
-print("🎓 Task-05 ready for submission!")
-print("="*80)
+    # ============================================================================
+    # COMPLETION
+    # ============================================================================
+    print("="*80)
+    print("✅ ANALYSIS COMPLETE!")
+    print("="*80)
+    print()
+    print("📊 Generated Files:")
+    print("   • 6 visualization PNG files")
+    print("   • 1 detailed summary report (analysis_summary.txt)")
+    print()
+    print("📁 All files saved in current directory")
+    print()
+    print("🎓 Task-05 ready for submission!")
+    print("="*80)